@@ -77,10 +77,12 @@ import asyncio
 from typing import Optional
 
 import twitchio
+from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
 from gtg.core import BaseTwitchNotifier
 from gtg.telegram import TelegramNotifier, ChatManager
+from gtg.telegram.broadcast import MAX_CONCURRENT_SENDS
 
 
 class BroadcastTelegramNotifier(TelegramNotifier):
@@ -89,14 +91,18 @@ class BroadcastTelegramNotifier(TelegramNotifier):
     def __init__(self, token: str, chats_file: str = "telegram_chats.json"):
         super().__init__(token)
         self.chat_manager = ChatManager(chats_file)
-        self.chat_manager.load_chats()
         self.telegram_app: Optional[Application] = None
+        self._send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+    async def prepare(self):
+        """Load registered chats before broadcasting"""
+        await self.chat_manager.load_chats()
 
     async def send_message(
         self, message: str, parse_mode: Optional[str] = None
     ) -> bool:
         """Broadcast message to all registered chats"""
-        chats = self.chat_manager.chats
+        chats = self.chat_manager.chats_snapshot
         if not chats:
             print(
                 "[TELEGRAM] No registered chats - send /start to the bot in your groups"
@@ -106,43 +112,58 @@ class BroadcastTelegramNotifier(TelegramNotifier):
         success_count = 0
         invalid_chats = set()
 
-        for chat_id in chats:
-            try:
-                await self.bot.send_message(
-                    chat_id=chat_id,
-                    text=message,
-                    parse_mode=parse_mode,
-                    disable_web_page_preview=True,
-                )
-                success_count += 1
-            except Exception as e:
-                if self.handle_telegram_error(e, chat_id):
+        results = await asyncio.gather(
+            *(self._send_one(chat_id, message, parse_mode) for chat_id in chats),
+            return_exceptions=True,
+        )
+
+        for chat_id, result in zip(chats, results):
+            if isinstance(result, TelegramError):
+                if await self.handle_telegram_error(result, chat_id):
                     invalid_chats.add(chat_id)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                success_count += 1
 
         self.chat_manager.remove_invalid_chats(invalid_chats)
         print(f"[TELEGRAM] Broadcast: {success_count}/{len(chats)} chats")
         return success_count > 0
 
+    async def _send_one(
+        self, chat_id: int, message: str, parse_mode: Optional[str] = None
+    ):
+        """Send message to a single chat, bounded by the broadcast semaphore"""
+        async with self._send_sem:
+            return await self.bot.send_message(
+                chat_id=chat_id,
+                text=message,
+                parse_mode=parse_mode,
+                disable_web_page_preview=True,
+            )
+
     async def setup_handlers(self):
         """Set up Telegram command handlers for chat discovery"""
-        self.telegram_app = Application.builder().token(self.token).build()
+        self.telegram_app = Application.builder().bot(self.bot).build()
 
         async def start_command(update, context):
             chat_id = update.effective_chat.id
-            chat_title = getattr(update.effective_chat, "title", "Private Chat")
-            self.chat_manager.add_chat(chat_id, chat_title)
+            if chat_id not in self.chat_manager:
+                chat_title = getattr(update.effective_chat, "title", "Private Chat")
+                self.chat_manager.add_chat(chat_id, chat_title)
             await update.message.reply_text(
                 f"✅ Stream notifications enabled!\\nChat ID: {chat_id}"
             )
 
         async def auto_register(update, context):
-            if update.effective_chat.type in ["group", "supergroup"]:
-                self.chat_manager.add_chat(
-                    update.effective_chat.id, update.effective_chat.title
-                )
+            chat = update.effective_chat
+            if chat.id not in self.chat_manager:
+                self.chat_manager.add_chat(chat.id, chat.title)
 
         self.telegram_app.add_handler(CommandHandler("start", start_command))
-        self.telegram_app.add_handler(MessageHandler(filters.ALL, auto_register))
+        self.telegram_app.add_handler(
+            MessageHandler(filters.ChatType.GROUPS, auto_register)
+        )
 
         await self.telegram_app.initialize()
         await self.telegram_app.start()
@@ -165,6 +186,7 @@ class ExampleStreamNotifier(BaseTwitchNotifier):
 
     async def on_ready(self):
         """Called when bot is ready"""
+        await self.telegram.prepare()
         print(f"Registered Telegram chats: {self.telegram.chat_manager.count}")
         await self.telegram.test_connection()
         await self.telegram.setup_handlers()
@@ -176,10 +198,9 @@ class ExampleStreamNotifier(BaseTwitchNotifier):
         """Send Telegram notification when stream goes online"""
         streamer_name = payload.broadcaster.display_name
         twitch_url = f"https://twitch.tv/{payload.broadcaster.name}"
-        message = self.telegram.format_stream_message(
+        await self.telegram.send_stream_message(
             streamer_name, title, category, twitch_url
         )
-        await self.telegram.send_message(message, parse_mode="MarkdownV2")
 
     async def on_stream_offline(self, payload: twitchio.StreamOffline):
         """Handle stream offline - no notification by default"""
@@ -191,8 +212,18 @@ class ExampleStreamNotifier(BaseTwitchNotifier):
 
     async def close(self):
         """Clean shutdown"""
-        if self.telegram.telegram_app:
-            await self.telegram.telegram_app.stop()
+        app = self.telegram.telegram_app
+        if app:
+            if app.updater.running:
+                await app.updater.stop()
+            if app.running:
+                await app.stop()
+            if self.telegram.owns_bot:
+                await app.shutdown()
+            else:
+                await app.updater.shutdown()
+        await self.telegram.chat_manager.close()
+        await self.telegram.close()
         await super().close()
 
 
@@ -31,7 +31,11 @@
         pythonDeps = p: [
           twitchio
           p.python-telegram-bot
+          p.h2
           p.click
+          p.dbus-next
+          p.orjson
+          p.uvloop
         ];
       in
       {
@@ -1,8 +1,13 @@
 """Main CLI interface for GTG stream notifier"""
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
+from typing import TYPE_CHECKING
 
 # Configure logging early to suppress import warnings
 logging.basicConfig(level=logging.ERROR, format="%(levelname)s: %(message)s")
@@ -11,12 +16,45 @@ logging.getLogger("twitchio.web").setLevel(logging.ERROR)
 logging.getLogger("aiohttp").setLevel(logging.ERROR)
 logging.getLogger("websockets").setLevel(logging.ERROR)
 
+# GTG's own status output goes to stdout without level prefixes. Records are
+# queued and written by a background thread, so chat logging never blocks
+# the event loop on stdout
+_gtg_handler = logging.StreamHandler(sys.stdout)
+_gtg_handler.setFormatter(logging.Formatter("%(message)s"))
+_gtg_listener = logging.handlers.QueueListener(queue.SimpleQueue(), _gtg_handler)
+_gtg_listener.start()
+atexit.register(_gtg_listener.stop)
+logging.getLogger("gtg").addHandler(logging.handlers.QueueHandler(_gtg_listener.queue))
+logging.getLogger("gtg").setLevel(logging.INFO)
+logging.getLogger("gtg").propagate = False
+
 import click
-import twitchio
 
-from .commands.broadcast import run_broadcast
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .core.cache import load_cache, save_cache
 from .core.config import load_config, validate_required
 
+# twitchio and telegram are imported inside commands so that --help and
+# cached lookups don't pay for loading them
+if TYPE_CHECKING:
+    import twitchio
+
+USER_ID_CACHE = "user_ids.json"
+# Seconds a cached login -> ID mapping is trusted before it is looked up again
+USER_ID_TTL = 24 * 60 * 60
+FETCH_USERS_LIMIT = 100
+
+
+def _run(main):
+    """Run a coroutine on uvloop when installed, else on the default loop"""
+    if uvloop:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
 
 @click.group()
 @click.version_option()
@@ -37,7 +75,8 @@ def broadcast():
 
     Automatically discovers and broadcasts to all chats the bot is added to.
     Requires: TWITCH_CLIENT_ID, TWITCH_CLIENT_SECRET, TWITCH_TARGET_USER, TELEGRAM_BOT_TOKEN
-    Optional: TWITCH_BOT_ID (enables chat monitoring)
+    Optional: TWITCH_BOT_ID (enables chat monitoring),
+    TELEGRAM_ARCHIVE_CHAT (broadcast via copyMessage from this chat)
     """
     required = [
         "TWITCH_CLIENT_ID",
@@ -48,15 +87,17 @@ def broadcast():
     if not validate_required(required):
         sys.exit(1)
 
-    asyncio.run(run_broadcast())
+    from .commands.broadcast import run_broadcast
+
+    _run(run_broadcast())
 
 
 @cli.command("get-user-id")
-@click.argument("username")
-def get_user_id(username: str):
-    """Convert Twitch username to user ID
+@click.argument("usernames", nargs=-1, required=True)
+def get_user_id(usernames: tuple[str, ...]):
+    """Convert Twitch usernames to user IDs
 
-    USERNAME: The Twitch username to look up
+    USERNAMES: One or more Twitch usernames to look up
 
     Requires: TWITCH_CLIENT_ID, TWITCH_CLIENT_SECRET
     """
@@ -64,22 +105,70 @@ def get_user_id(username: str):
     if not validate_required(required):
         sys.exit(1)
 
-    config = load_config()
-    asyncio.run(
-        _get_user_id_async(
-            username, config["TWITCH_CLIENT_ID"], config["TWITCH_CLIENT_SECRET"]
+    logins = list(dict.fromkeys(username.lower() for username in usernames))
+
+    # IDs are stable but logins are released and reused after renames, so
+    # cached mappings expire after USER_ID_TTL and are looked up again
+    cache = load_cache(USER_ID_CACHE)
+    now = time.time()
+    user_ids = {
+        login: entry["id"]
+        for login, entry in cache.items()
+        if isinstance(entry, dict) and now - entry.get("fetched_at", 0) < USER_ID_TTL
+    }
+    missing = [login for login in logins if login not in user_ids]
+
+    if missing:
+        config = load_config()
+        fetched = _run(
+            _get_user_ids_async(
+                missing, config["TWITCH_CLIENT_ID"], config["TWITCH_CLIENT_SECRET"]
+            )
         )
-    )
+        # Drop stale entries for logins that no longer resolve
+        for login in missing:
+            cache.pop(login, None)
+        for login, user_id in fetched.items():
+            cache[login] = {"id": user_id, "fetched_at": now}
+        user_ids.update(fetched)
+        save_cache(USER_ID_CACHE, cache)
+
+    not_found = False
+    for login in logins:
+        if login in user_ids:
+            click.echo(f"{login}: {user_ids[login]}")
+        else:
+            click.echo(f"User not found: {login}")
+            not_found = True
 
+    if not_found:
+        sys.exit(1)
+
+
+async def _get_user_ids_async(
+    logins: list[str], client_id: str, client_secret: str
+) -> dict[str, str]:
+    """Async implementation of get_user_id command, returns login -> user ID"""
+    from .core.twitch_token import get_or_refresh_token
+
+    token, _ = await get_or_refresh_token(client_id, client_secret)
+    users = await _fetch_users(logins, client_id, client_secret, token)
+
+    return {user.name.lower(): user.id for user in users}
+
+
+async def _fetch_users(
+    logins: list[str], client_id: str, client_secret: str, token: str
+) -> list["twitchio.User"]:
+    """Look up users with an existing app token, skipping the token request"""
+    import twitchio
 
-async def _get_user_id_async(username: str, client_id: str, client_secret: str):
-    """Async implementation of get_user_id command"""
     client = twitchio.Client(client_id=client_id, client_secret=client_secret)
     async with client:
-        await client.login()
-        users = await client.fetch_users(logins=[username])
-        if users:
-            click.echo(f"User ID for {username}: {users[0].id}")
-        else:
-            click.echo(f"User not found: {username}")
-            sys.exit(1)
+        await client.login(token=token)
+        users = []
+        # Helix accepts at most FETCH_USERS_LIMIT logins per request
+        for i in range(0, len(logins), FETCH_USERS_LIMIT):
+            batch = logins[i : i + FETCH_USERS_LIMIT]
+            users.extend(await client.fetch_users(logins=batch))
+        return users
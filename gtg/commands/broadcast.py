@@ -1,14 +1,18 @@
 """Broadcast stream notification command implementation"""
 
 import asyncio
+import logging
 from typing import Optional
 
 import twitchio
 
 from ..core.config import load_config
 from ..core.twitch import BaseTwitchNotifier
+from ..core.twitch_token import get_or_refresh_token
 from ..telegram.broadcast import BroadcastNotifier
 
+log = logging.getLogger(__name__)
+
 
 class BroadcastStreamNotifier(BaseTwitchNotifier):
     """Broadcast stream notifier combining Twitch monitoring with multi-chat Telegram broadcasting"""
@@ -20,15 +24,18 @@ class BroadcastStreamNotifier(BaseTwitchNotifier):
         target_user_id: str,
         telegram_token: str,
         bot_id: Optional[str] = None,
+        archive_chat_id: Optional[str] = None,
     ):
         super().__init__(client_id, client_secret, target_user_id, bot_id)
-        self.telegram = BroadcastNotifier(telegram_token, target_user_id)
+        self.telegram = BroadcastNotifier(
+            telegram_token, target_user_id, archive_chat_id=archive_chat_id
+        )
 
     async def on_ready(self):
         """Initialize Telegram connection and setup handlers"""
         await self.telegram.test_connection()
         await self.telegram.setup_handlers()
-        print(f"[TELEGRAM] Registered chats: {self.telegram.registered_chat_count}")
+        log.info("[TELEGRAM] Registered chats: %d", self.telegram.registered_chat_count)
 
     async def on_stream_online(
         self, payload: twitchio.StreamOnline, title: str, category: str
@@ -36,10 +43,9 @@ class BroadcastStreamNotifier(BaseTwitchNotifier):
         """Broadcast stream online notification to all registered chats"""
         streamer_name = payload.broadcaster.display_name
         twitch_url = f"https://twitch.tv/{payload.broadcaster.name}"
-        message = self.telegram.format_stream_message(
+        await self.telegram.send_stream_message(
             streamer_name, title, category, twitch_url
         )
-        await self.telegram.send_message(message, "MarkdownV2")
 
     async def on_stream_offline(self, payload: twitchio.StreamOffline):
         """Handle stream offline - currently no Telegram notification"""
@@ -64,12 +70,17 @@ async def run_broadcast():
         target_user_id=config["TWITCH_TARGET_USER"],
         telegram_token=config["TELEGRAM_BOT_TOKEN"],
         bot_id=config.get("TWITCH_BOT_ID"),
+        archive_chat_id=config.get("TELEGRAM_ARCHIVE_CHAT"),
     )
 
     try:
+        await notifier.telegram.prepare()
+        token, _ = await get_or_refresh_token(
+            config["TWITCH_CLIENT_ID"], config["TWITCH_CLIENT_SECRET"]
+        )
         async with notifier:
-            await notifier.start()
+            await notifier.start(token=token)
     except KeyboardInterrupt:
-        print("\nShutting down broadcast stream notifier...")
+        log.info("\nShutting down broadcast stream notifier...")
     finally:
         await notifier.cleanup()
@@ -1,5 +1,12 @@
 """Core utilities for GTG"""
 
-from .twitch import BaseTwitchNotifier
-
 __all__ = ["BaseTwitchNotifier"]
+
+
+def __getattr__(name):
+    # Import lazily so config/cache helpers don't pull in twitchio
+    if name == "BaseTwitchNotifier":
+        from .twitch import BaseTwitchNotifier
+
+        return BaseTwitchNotifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
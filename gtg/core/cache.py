@@ -0,0 +1,34 @@
+"""On-disk cache for data reused across GTG invocations"""
+
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "gtg"
+)
+
+
+def load_cache(name: str) -> dict:
+    """Load a JSON cache file, returning an empty dict if missing or unreadable"""
+    try:
+        with open(os.path.join(CACHE_DIR, name), "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(name: str, data: dict):
+    """Save a JSON cache file readable only by the current user"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd = os.open(
+            os.path.join(CACHE_DIR, name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+    except OSError as e:
+        log.error("[ERROR] Failed to write cache %s: %s", name, e)
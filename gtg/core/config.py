@@ -1,18 +1,29 @@
 """Configuration management for GTG"""
 
+import functools
 import os
 import sys
+import types
+from typing import Mapping
 
 
-def load_config() -> dict[str, str | None]:
-    """Load all GTG environment variables into a config dict"""
-    return {
-        "TWITCH_CLIENT_ID": os.getenv("TWITCH_CLIENT_ID"),
-        "TWITCH_CLIENT_SECRET": os.getenv("TWITCH_CLIENT_SECRET"),
-        "TWITCH_TARGET_USER": os.getenv("TWITCH_TARGET_USER"),
-        "TWITCH_BOT_ID": os.getenv("TWITCH_BOT_ID"),
-        "TELEGRAM_BOT_TOKEN": os.getenv("TELEGRAM_BOT_TOKEN"),
-    }
+@functools.lru_cache(maxsize=1)
+def load_config() -> Mapping[str, str | None]:
+    """Load all GTG environment variables into a read-only config mapping
+
+    The environment doesn't change after startup, so the mapping is built once;
+    call load_config.cache_clear() to re-read it.
+    """
+    return types.MappingProxyType(
+        {
+            "TWITCH_CLIENT_ID": os.getenv("TWITCH_CLIENT_ID"),
+            "TWITCH_CLIENT_SECRET": os.getenv("TWITCH_CLIENT_SECRET"),
+            "TWITCH_TARGET_USER": os.getenv("TWITCH_TARGET_USER"),
+            "TWITCH_BOT_ID": os.getenv("TWITCH_BOT_ID"),
+            "TELEGRAM_BOT_TOKEN": os.getenv("TELEGRAM_BOT_TOKEN"),
+            "TELEGRAM_ARCHIVE_CHAT": os.getenv("TELEGRAM_ARCHIVE_CHAT"),
+        }
+    )
 
 
 def validate_required(keys: list[str]) -> bool:
@@ -41,6 +52,7 @@ def validate_required(keys: list[str]) -> bool:
 
         print("\nOptional variables:")
         print("  TWITCH_BOT_ID - enables chat monitoring")
+        print("  TELEGRAM_ARCHIVE_CHAT - chat to post broadcasts to once and copy from")
 
         return False
     return True
@@ -1,10 +1,37 @@
 """Desktop notification utilities"""
 
-import subprocess
+import asyncio
+import logging
 
+try:
+    from dbus_next import Variant
+    from dbus_next.aio import MessageBus
+except ImportError:
+    MessageBus = None
 
-def send_desktop_notification(title: str, body: str, urgency: str = "critical") -> bool:
-    """Send desktop notification using notify-send
+log = logging.getLogger(__name__)
+
+NOTIFICATIONS_BUS_NAME = "org.freedesktop.Notifications"
+NOTIFICATIONS_PATH = "/org/freedesktop/Notifications"
+URGENCY_LEVELS = {"low": 0, "normal": 1, "critical": 2}
+
+_dbus_lock = asyncio.Lock()
+_dbus_notifications = None
+_dbus_unavailable = MessageBus is None
+
+# Keeps notify-send exit watchers alive until they finish
+_pending_watchers: set = set()
+
+
+async def send_desktop_notification_async(
+    title: str, body: str, urgency: str = "critical"
+) -> bool:
+    """Send desktop notification over D-Bus without spawning a process
+
+    Talks to org.freedesktop.Notifications on the session bus through a
+    connection shared by all calls. Falls back to spawning notify-send
+    without waiting for it when dbus-next or the session bus is unavailable,
+    or when the D-Bus call fails.
 
     Args:
         title: Notification title
@@ -14,15 +41,75 @@ def send_desktop_notification(title: str, body: str, urgency: str = "critical")
     Returns:
         True if notification was sent successfully, False otherwise
     """
+    global _dbus_notifications
+
+    notifications = await _get_dbus_notifications()
+    if notifications is None:
+        return await _spawn_notify_send(title, body, urgency)
+
     try:
-        subprocess.run(
-            ["notify-send", "-u", urgency, "-i", "video-display", title, body],
-            check=True,
+        await notifications.call_notify(
+            "gtg",
+            0,
+            "video-display",
+            title,
+            body,
+            [],
+            {"urgency": Variant("y", URGENCY_LEVELS.get(urgency, 1))},
+            -1,
         )
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Failed to send desktop notification: {e}")
-        return False
+    except Exception as e:
+        # Drop the connection so the next notification reconnects, and
+        # deliver this one through notify-send instead
+        if _dbus_notifications is notifications:
+            _dbus_notifications = None
+        log.warning("D-Bus notification failed, using notify-send: %s", e)
+        return await _spawn_notify_send(title, body, urgency)
+
+
+async def _spawn_notify_send(title: str, body: str, urgency: str) -> bool:
+    """Start notify-send and report its exit status in the background"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "notify-send", "-u", urgency, "-i", "video-display", title, body
+        )
     except FileNotFoundError:
-        print("Desktop notifications unavailable: notify-send not found")
+        log.warning("Desktop notifications unavailable: notify-send not found")
         return False
+
+    watcher = asyncio.create_task(_report_notify_send_exit(proc))
+    _pending_watchers.add(watcher)
+    watcher.add_done_callback(_pending_watchers.discard)
+    return True
+
+
+async def _report_notify_send_exit(proc: asyncio.subprocess.Process):
+    """Wait for notify-send and log a warning if it failed"""
+    returncode = await proc.wait()
+    if returncode:
+        log.warning(
+            "Failed to send desktop notification: notify-send exited %s", returncode
+        )
+
+
+async def _get_dbus_notifications():
+    """Connect to the notification service once and cache its interface"""
+    global _dbus_notifications, _dbus_unavailable
+
+    async with _dbus_lock:
+        if _dbus_notifications is None and not _dbus_unavailable:
+            try:
+                bus = await MessageBus().connect()
+                introspection = await bus.introspect(
+                    NOTIFICATIONS_BUS_NAME, NOTIFICATIONS_PATH
+                )
+                proxy = bus.get_proxy_object(
+                    NOTIFICATIONS_BUS_NAME, NOTIFICATIONS_PATH, introspection
+                )
+                _dbus_notifications = proxy.get_interface(NOTIFICATIONS_BUS_NAME)
+            except Exception as e:
+                _dbus_unavailable = True
+                log.warning("D-Bus notifications unavailable, using notify-send: %s", e)
+
+    return _dbus_notifications
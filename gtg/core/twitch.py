@@ -1,15 +1,50 @@
 """Base Twitch notification classes using TwitchIO AutoBot"""
 
-import datetime
+import asyncio
+import logging
 import subprocess
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 import twitchio
 from twitchio import eventsub
 from twitchio.ext import commands
 
-from .notifications import send_desktop_notification
+from .notifications import send_desktop_notification_async
+
+log = logging.getLogger(__name__)
+
+# Chat prefixes indexed by (broadcaster << 2) | (moderator << 1) | subscriber,
+# so the highest role wins
+_USER_PREFIXES = (
+    "[CHAT]",
+    "[SUB]",
+    "[MOD]",
+    "[MOD]",
+    "[STREAMER]",
+    "[STREAMER]",
+    "[STREAMER]",
+    "[STREAMER]",
+)
+
+# Desktop notifications allowed in flight at once, so a stalled notification
+# daemon can't pile up unbounded D-Bus calls
+MAX_PENDING_NOTIFICATIONS = 8
+
+# Last formatted wall-clock second, reused by every event within that second
+_last_hms: Tuple[int, str] = (0, "")
+
+
+def _now_hms() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _last_hms
+
+    now = int(time.time())
+    if now != _last_hms[0]:
+        t = time.localtime(now)
+        _last_hms = (now, f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+    return _last_hms[1]
 
 
 class BaseTwitchNotifier(commands.AutoBot, ABC):
@@ -24,6 +59,8 @@ class BaseTwitchNotifier(commands.AutoBot, ABC):
     ):
         self.target_user_id = target_user_id
         self.chat_enabled = bool(bot_id)
+        self._notify_sem = asyncio.Semaphore(MAX_PENDING_NOTIFICATIONS)
+        self._notify_tasks: Set[asyncio.Task] = set()
 
         # Build subscriptions
         subs = [
@@ -46,17 +83,25 @@ class BaseTwitchNotifier(commands.AutoBot, ABC):
             subscriptions=subs,
         )
 
+        # twitchio only dispatches to event_* attributes that are set, so
+        # without chat monitoring no task is created per chat message
+        if not self.chat_enabled:
+            self.event_message = None
+
     async def event_ready(self):
         """Called when bot is ready - delegates to subclass"""
-        print(f"Stream notifier ready! Monitoring user ID: {self.target_user_id}")
-        print(f"Chat monitoring: {'ENABLED' if self.chat_enabled else 'DISABLED'}")
+        log.info("Stream notifier ready! Monitoring user ID: %s", self.target_user_id)
+        log.info("Chat monitoring: %s", "ENABLED" if self.chat_enabled else "DISABLED")
         await self.on_ready()
 
     async def event_stream_online(self, payload: twitchio.StreamOnline):
         """Handle stream online event"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         streamer_name = payload.broadcaster.display_name
-        print(f"[{timestamp}] [LIVE] {streamer_name} started streaming!")
+        log.info(
+            "[%s] [LIVE] %s started streaming!",
+            _now_hms(),
+            streamer_name,
+        )
 
         # Get stream details
         title = getattr(payload, "title", "Stream")
@@ -64,52 +109,63 @@ class BaseTwitchNotifier(commands.AutoBot, ABC):
 
         # Send notifications
         await self.on_stream_online(payload, title, category)
-        self._send_desktop_notification(streamer_name, title, category)
+        await self._send_desktop_notification(streamer_name, title, category)
 
     async def event_stream_offline(self, payload: twitchio.StreamOffline):
         """Handle stream offline event"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         streamer_name = payload.broadcaster.display_name
-        print(f"[{timestamp}] [OFFLINE] {streamer_name} went offline")
+        log.info("[%s] [OFFLINE] %s went offline", _now_hms(), streamer_name)
         await self.on_stream_offline(payload)
 
     async def event_message(self, payload: twitchio.ChatMessage):
         """Handle chat messages"""
-        if not self.chat_enabled:
-            return
-
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        prefix = self._get_user_prefix(payload.chatter)
-        display_name = payload.chatter.display_name
+        chatter = payload.chatter
+        display_name = chatter.display_name
         message_text = payload.text
 
-        print(f"[{timestamp}] {prefix} {display_name}: {message_text}")
+        # Skip timestamp and prefix work entirely when chat logging is off
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                "[%s] %s %s: %s",
+                _now_hms(),
+                self._get_user_prefix(chatter),
+                display_name,
+                message_text,
+            )
 
         # Send desktop notification for chat messages
         title = f"{display_name} in chat"
-        send_desktop_notification(title, message_text, urgency="normal")
+        self._notify_in_background(title, message_text, "normal")
 
         await self.on_chat_message(payload)
 
     @staticmethod
     def _get_user_prefix(chatter) -> str:
         """Get user type prefix for chat messages"""
-        if chatter.broadcaster:
-            return "[STREAMER]"
-        elif chatter.moderator:
-            return "[MOD]"
-        elif chatter.subscriber:
-            return "[SUB]"
-        else:
-            return "[CHAT]"
-
-    def _send_desktop_notification(self, streamer_name: str, title: str, category: str):
-        """Send desktop notification using notify-send"""
+        return _USER_PREFIXES[
+            (chatter.broadcaster << 2) | (chatter.moderator << 1) | chatter.subscriber
+        ]
+
+    async def _send_desktop_notification(
+        self, streamer_name: str, title: str, category: str
+    ):
+        """Send stream online desktop notification"""
         body = title
         if category:
-            body += f"\\nPlaying: {category}"
+            body += f"\nPlaying: {category}"
+
+        self._notify_in_background(f"{streamer_name} is LIVE!", body, "critical")
 
-        send_desktop_notification(f"{streamer_name} is LIVE!", body, urgency="critical")
+    def _notify_in_background(self, title: str, body: str, urgency: str):
+        """Send a desktop notification without holding up event handling"""
+        task = asyncio.create_task(self._notify_async(title, body, urgency))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    async def _notify_async(self, title: str, body: str, urgency: str):
+        """Send a desktop notification, limiting how many are in flight"""
+        async with self._notify_sem:
+            await send_desktop_notification_async(title, body, urgency=urgency)
 
     # Abstract methods to be implemented by subclasses
     @abstractmethod
@@ -129,7 +185,6 @@ class BaseTwitchNotifier(commands.AutoBot, ABC):
         """Called when stream goes offline"""
         pass
 
-    @abstractmethod
     async def on_chat_message(self, payload: twitchio.ChatMessage):
         """Called when chat message is received (if chat monitoring enabled)"""
         pass
@@ -0,0 +1,50 @@
+"""Twitch app access token caching"""
+
+import time
+
+from twitchio.authentication import OAuth
+
+from .cache import load_cache, save_cache
+
+TOKEN_CACHE = "twitch_token.json"
+
+# Refresh tokens this many seconds before Twitch would expire them
+EXPIRY_MARGIN = 300
+
+
+async def get_or_refresh_token(client_id: str, client_secret: str) -> tuple[str, float]:
+    """Get a cached app token, requesting a new one if missing or expired
+
+    A cached token that Twitch has revoked is replaced by twitchio itself,
+    which requests a new app token when an API call fails with 401.
+
+    Args:
+        client_id: Twitch app client ID
+        client_secret: Twitch app client secret
+
+    Returns:
+        The access token and its expiry as a Unix timestamp
+    """
+    cached = load_cache(TOKEN_CACHE)
+    if (
+        cached.get("client_id") == client_id
+        and cached.get("expires_at", 0) - EXPIRY_MARGIN > time.time()
+    ):
+        return cached["token"], cached["expires_at"]
+
+    oauth = OAuth(client_id=client_id, client_secret=client_secret)
+    try:
+        payload = await oauth.client_credentials_token()
+    finally:
+        await oauth.close()
+
+    expires_at = time.time() + payload.expires_in
+    save_cache(
+        TOKEN_CACHE,
+        {
+            "client_id": client_id,
+            "token": payload.access_token,
+            "expires_at": expires_at,
+        },
+    )
+    return payload.access_token, expires_at
@@ -1,11 +1,127 @@
 """Abstract Telegram notification interface"""
 
+import asyncio
+import datetime
+import functools
+import logging
+import random
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 import telegram
-from telegram.error import TelegramError
-from telegram.helpers import escape_markdown
+from telegram.constants import ParseMode
+from telegram.error import (
+    BadRequest,
+    Forbidden,
+    NetworkError,
+    RetryAfter,
+    TelegramError,
+)
+from telegram.request import HTTPXRequest
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+from .ratelimit import (
+    GLOBAL_SEND_RATE,
+    PER_CHAT_SEND_RATE,
+    AsyncTokenBucket,
+    PerKeyLimiter,
+)
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Translation table escaping every MarkdownV2 reserved character in one pass
+_MARKDOWN_V2_ESCAPES = str.maketrans({c: "\\" + c for c in r"\_*[]()~`>#+-=|{}.!"})
+
+
+@functools.lru_cache(maxsize=256)
+def _format_stream_message(streamer_name: str, twitch_url: str) -> str:
+    """Build the escaped stream online message, cached per stream"""
+    return f"""💊 {streamer_name} is LIVE 💊
+{twitch_url}""".translate(_MARKDOWN_V2_ESCAPES)
+
+
+# Keep-alive connections shared by all notifiers using the same bot token
+CONNECTION_POOL_SIZE = 64
+
+# With h2 installed, concurrent sends multiplex over one TLS connection
+HTTP_VERSION = "2" if h2 else "1.1"
+
+# One Bot per token, so every notifier reuses the same warm connection pool.
+# Telegram's limits apply per bot, so the rate limiters are shared with it
+_BOT_CACHE: Dict[str, Tuple[telegram.Bot, AsyncTokenBucket, PerKeyLimiter]] = {}
+# Notifiers holding each cached Bot; the last one to close shuts it down
+_BOT_REFS: Dict[str, int] = {}
+_BOT_INIT_LOCK = asyncio.Lock()
+
+
+def _acquire_shared(
+    token: str,
+) -> Tuple[telegram.Bot, AsyncTokenBucket, PerKeyLimiter]:
+    """Get the shared Bot and its global and per-chat limiters for token"""
+    _BOT_REFS[token] = _BOT_REFS.get(token, 0) + 1
+    shared = _BOT_CACHE.get(token)
+    if shared is None:
+        bot = telegram.Bot(
+            token=token,
+            request=HTTPXRequest(
+                connection_pool_size=CONNECTION_POOL_SIZE,
+                pool_timeout=5.0,
+                connect_timeout=5.0,
+                read_timeout=10.0,
+                http_version=HTTP_VERSION,
+            ),
+        )
+        shared = (
+            bot,
+            AsyncTokenBucket(GLOBAL_SEND_RATE, GLOBAL_SEND_RATE),
+            PerKeyLimiter(PER_CHAT_SEND_RATE, PER_CHAT_SEND_RATE),
+        )
+        _BOT_CACHE[token] = shared
+    return shared
+
+
+async def with_backoff(call: Callable[[], Awaitable[T]], max_tries: int = 6) -> T:
+    """Run call, retrying network failures with capped exponential backoff
+
+    Waits 0.5s, 1s, 2s, ... up to 30s plus jitter between attempts, or as
+    long as Telegram asks on RetryAfter. Other errors are raised at once.
+    """
+    for attempt in range(max_tries):
+        try:
+            return await call()
+        except RetryAfter as e:
+            if attempt == max_tries - 1:
+                raise
+            delay = e.retry_after
+            if isinstance(delay, datetime.timedelta):
+                delay = delay.total_seconds()
+        except BadRequest:
+            # A subclass of NetworkError, but a 400 won't succeed on retry
+            raise
+        except NetworkError as e:
+            if attempt == max_tries - 1:
+                raise
+            delay = min(30.0, 0.5 * 2**attempt) + random.uniform(0, 0.25)
+            log.warning("[TELEGRAM] %s, retrying in %.1fs", e, delay)
+        await asyncio.sleep(delay)
+
+
+async def _release_shared(token: str):
+    """Drop one hold on token's Bot, shutting it down after the last one"""
+    _BOT_REFS[token] -= 1
+    if _BOT_REFS[token]:
+        return
+    del _BOT_REFS[token]
+    bot, _, _ = _BOT_CACHE.pop(token)
+    await bot.shutdown()
+    # shutdown() skips bots that were never initialized
+    await bot.request.shutdown()
 
 
 class TelegramNotifier(ABC):
@@ -13,18 +129,57 @@ class TelegramNotifier(ABC):
 
     def __init__(self, token: str):
         self.token = token
-        self.bot = telegram.Bot(token=token)
+        self.bot, self._global_bucket, self._per_chat = _acquire_shared(token)
+        self._closed = False
 
     async def test_connection(self) -> bool:
-        """Test Telegram bot connection and print status"""
+        """Test Telegram bot connection and log status"""
         try:
-            me = await self.bot.get_me()
-            print(f"[TELEGRAM] Connected as: {me.first_name} (@{me.username})")
+            await with_backoff(self.initialize)
+            me = self.bot.bot
+            log.info("[TELEGRAM] Connected as: %s (@%s)", me.first_name, me.username)
             return True
         except Exception as e:
-            print(f"[TELEGRAM] Connection test failed: {e}")
+            log.error("[TELEGRAM] Connection test failed: %s", e)
             return False
 
+    async def _rate_limited(
+        self, chat_id: Union[int, str], call: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a Bot API call for chat_id within the global and per-chat limits
+
+        If Telegram still answers with RetryAfter, wait as instructed and
+        retry once.
+        """
+        for attempt in range(2):
+            async with self._global_bucket, self._per_chat.get(chat_id):
+                try:
+                    return await call()
+                except RetryAfter as e:
+                    if attempt:
+                        raise
+                    delay = e.retry_after
+            if isinstance(delay, datetime.timedelta):
+                delay = delay.total_seconds()
+            log.warning("[TELEGRAM] Rate limited, retrying in %ss", delay)
+            await asyncio.sleep(delay)
+
+    @property
+    def owns_bot(self) -> bool:
+        """Whether no other open notifier shares this notifier's Bot"""
+        return not self._closed and _BOT_REFS.get(self.token) == 1
+
+    async def close(self):
+        """Release the shared Bot, shutting it down if no notifier still uses it"""
+        if not self._closed:
+            self._closed = True
+            await _release_shared(self.token)
+
+    async def initialize(self):
+        """Initialize the shared bot once, fetching its own user via getMe"""
+        async with _BOT_INIT_LOCK:
+            await self.bot.initialize()
+
     @abstractmethod
     async def send_message(
         self, message: str, parse_mode: Optional[str] = None
@@ -36,25 +191,38 @@ class TelegramNotifier(ABC):
         self, streamer_name: str, title: str, category: str, twitch_url: str
     ) -> str:
         """Format stream online message with proper Telegram markdown escaping"""
+        return _format_stream_message(streamer_name, twitch_url)
 
-        return escape_markdown(
-            f"""💊 {streamer_name} is LIVE 💊
-{twitch_url}""",
-            version=2,
-        )
+    async def send_stream_message(
+        self, streamer_name: str, title: str, category: str, twitch_url: str
+    ) -> bool:
+        """Format the stream online message once and send it to all targets"""
+        message = self.format_stream_message(streamer_name, title, category, twitch_url)
+        # format_stream_message escapes for MarkdownV2, so the two go together
+        return await self.send_message(message, ParseMode.MARKDOWN_V2)
 
     async def handle_telegram_error(
         self, error: TelegramError, chat_id: Optional[int] = None
     ) -> bool:
-        """Handle Telegram errors and return True if chat should be removed"""
-        error_msg = str(error).lower()
-        if "chat not found" in error_msg or "bot was blocked" in error_msg:
+        """Handle Telegram errors and return True if chat should be removed
+
+        Forbidden (bot blocked or kicked) and "chat not found" are permanent;
+        timeouts, network errors and other failures keep the chat.
+        """
+        if isinstance(error, Forbidden):
+            remove = True
+        elif isinstance(error, BadRequest):
+            remove = "chat not found" in error.message.lower()
+        else:
+            remove = False
+
+        if remove:
             if chat_id:
-                print(f"[TELEGRAM] Removed invalid chat {chat_id}: {error}")
+                log.info("[TELEGRAM] Removed invalid chat %s: %s", chat_id, error)
             return True
         else:
             if chat_id:
-                print(f"[TELEGRAM] Failed to send to {chat_id}: {error}")
+                log.warning("[TELEGRAM] Failed to send to %s: %s", chat_id, error)
             else:
-                print(f"[TELEGRAM] Failed to send message: {error}")
+                log.warning("[TELEGRAM] Failed to send message: %s", error)
             return False
@@ -1,71 +1,150 @@
 """Broadcast Telegram notification strategy with chat discovery"""
 
 import asyncio
-from typing import Optional, Set
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
 
-from telegram import Update
+from telegram import Message, Update
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
 
-from .base import TelegramNotifier
+from .base import TelegramNotifier, with_backoff
 from .chat_manager import ChatManager
 
+log = logging.getLogger(__name__)
+
+# Stay below Telegram's ~30 messages/second global limit
+MAX_CONCURRENT_SENDS = 25
+
 
 class BroadcastNotifier(TelegramNotifier):
     """Telegram notifier that broadcasts to all registered chats with auto-discovery"""
 
     def __init__(
-        self, token: str, target_user_id: str, chats_file: str = "telegram_chats.json"
+        self,
+        token: str,
+        target_user_id: str,
+        chats_file: str = "telegram_chats.json",
+        archive_chat_id: Optional[str] = None,
     ):
         super().__init__(token)
         self.target_user_id = target_user_id
+        self.archive_chat_id = archive_chat_id
         self.chat_manager = ChatManager(chats_file)
         self.telegram_app: Optional[Application] = None
-        self.chat_manager.load_chats()
+        self._polling_task: Optional[asyncio.Task] = None
+        self._send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+    async def prepare(self):
+        """Load registered chats; call before broadcasting"""
+        await self.chat_manager.load_chats()
 
     async def send_message(
         self, message: str, parse_mode: Optional[str] = None
     ) -> bool:
         """Broadcast message to all registered chats"""
-        chats = self.chat_manager.chats
+        if not self.chat_manager.loaded:
+            await self.prepare()
+        chats = self.chat_manager.chats_snapshot
         if not chats:
-            print(
+            log.warning(
                 "[TELEGRAM] No registered chats - send /start to the bot in your groups"
             )
             return False
 
-        success_count = 0
-        invalid_chats: Set[int] = set()
-
-        for chat_id in chats:
-            try:
-                await self.bot.send_message(
-                    chat_id=chat_id,
-                    text=message,
-                    parse_mode=parse_mode,
-                    disable_web_page_preview=True,
-                )
-                success_count += 1
-            except TelegramError as e:
-                if await self.handle_telegram_error(e, chat_id):
-                    invalid_chats.add(chat_id)
+        # Post once to the archive chat so each broadcast target only needs
+        # a small copyMessage request instead of the full message body
+        source = await self._post_to_archive(message, parse_mode)
+
+        # Every chat gets the same request apart from chat_id, so pick the
+        # method and build its arguments once
+        if source:
+            send = self.bot.copy_message
+            params = {"from_chat_id": source.chat_id, "message_id": source.message_id}
+            # The archive chat already has the original message
+            targets = [chat_id for chat_id in chats if chat_id != source.chat_id]
+        else:
+            send = self.bot.send_message
+            params = {
+                "text": message,
+                "parse_mode": parse_mode,
+                "disable_web_page_preview": True,
+            }
+            targets = chats
+
+        # Sends are independent round trips, so dispatch them concurrently
+        results = await asyncio.gather(
+            *(self._send_one(chat_id, send, params) for chat_id in targets),
+        )
+
+        # A skipped archive chat counts as delivered
+        success_count = len(chats) - len(targets)
+        success_count += sum(sent for _, sent, _ in results)
+        invalid_chats: Set[int] = {chat_id for chat_id, _, remove in results if remove}
 
         # Remove invalid chats
         if invalid_chats:
             self.chat_manager.remove_invalid_chats(invalid_chats)
 
         total_attempted = len(chats)
-        print(f"[TELEGRAM] Broadcast complete: {success_count}/{total_attempted} chats")
+        log.info(
+            "[TELEGRAM] Broadcast complete: %d/%d chats", success_count, total_attempted
+        )
         return success_count > 0
 
+    async def _post_to_archive(
+        self, message: str, parse_mode: Optional[str] = None
+    ) -> Optional[Message]:
+        """Post message to the archive chat, if configured, for copying"""
+        if not self.archive_chat_id:
+            return None
+        try:
+            return await self._rate_limited(
+                self.archive_chat_id,
+                lambda: self.bot.send_message(
+                    chat_id=self.archive_chat_id,
+                    text=message,
+                    parse_mode=parse_mode,
+                    disable_web_page_preview=True,
+                ),
+            )
+        except TelegramError as e:
+            log.warning("[TELEGRAM] Archive chat unavailable, sending directly: %s", e)
+            return None
+
+    async def _send_one(
+        self,
+        chat_id: int,
+        send: Callable[..., Awaitable[Any]],
+        params: Dict[str, Any],
+    ) -> Tuple[int, bool, bool]:
+        """Send to a single chat, bounded by the broadcast semaphore
+
+        Returns (chat_id, sent, remove), where remove is True if the chat is
+        no longer reachable and should be dropped.
+        """
+        try:
+            async with self._send_sem:
+                await self._rate_limited(
+                    chat_id, lambda: send(chat_id=chat_id, **params)
+                )
+        except TelegramError as e:
+            return chat_id, False, await self.handle_telegram_error(e, chat_id)
+        return chat_id, True, False
+
     async def setup_handlers(self):
         """Set up Telegram bot handlers for chat discovery"""
-        self.telegram_app = Application.builder().token(self.token).build()
+        # Registration checks need the full chat list
+        if not self.chat_manager.loaded:
+            await self.prepare()
+        # Share the notifier's bot so handlers and broadcasts use one pool
+        self.telegram_app = Application.builder().bot(self.bot).build()
 
         async def start_command(update: Update, context):
             chat_id = update.effective_chat.id
-            chat_title = getattr(update.effective_chat, "title", "Private Chat")
-            self.chat_manager.add_chat(chat_id, chat_title)
+            if chat_id not in self.chat_manager:
+                chat_title = getattr(update.effective_chat, "title", "Private Chat")
+                self.chat_manager.add_chat(chat_id, chat_title)
 
             await update.message.reply_text(
                 f"✅ Stream notifications enabled!\n"
@@ -82,29 +161,57 @@ class BroadcastNotifier(TelegramNotifier):
             )
 
         async def auto_register(update: Update, context):
-            # Only register group chats, not private chats
-            if update.effective_chat.type in ["group", "supergroup"]:
-                chat_id = update.effective_chat.id
-                chat_title = update.effective_chat.title
-                self.chat_manager.add_chat(chat_id, chat_title)
+            # Runs for every group message, so bail out early for known chats
+            chat = update.effective_chat
+            if chat.id not in self.chat_manager:
+                self.chat_manager.add_chat(chat.id, chat.title)
 
         # Add handlers
         self.telegram_app.add_handler(CommandHandler("start", start_command))
         self.telegram_app.add_handler(CommandHandler("status", status_command))
-        self.telegram_app.add_handler(MessageHandler(filters.ALL, auto_register))
+        # Only group chats are auto-registered, so let the filter drop private
+        # messages before the callback is scheduled
+        self.telegram_app.add_handler(
+            MessageHandler(filters.ChatType.GROUPS, auto_register)
+        )
 
         # Start the telegram bot
-        await self.telegram_app.initialize()
+        await with_backoff(self.telegram_app.initialize)
         await self.telegram_app.start()
 
-        # Start polling in background
-        asyncio.create_task(self.telegram_app.updater.start_polling())
-        print(f"[TELEGRAM] Add bot to groups and send /start to register them")
+        # Start polling in background; once running, the updater retries
+        # failed getUpdates calls on its own
+        self._polling_task = asyncio.create_task(
+            with_backoff(self.telegram_app.updater.start_polling)
+        )
+        log.info("[TELEGRAM] Add bot to groups and send /start to register them")
 
     async def cleanup(self):
         """Clean shutdown of Telegram handlers"""
+        if self._polling_task:
+            # A start_polling retry still waiting must not fire after shutdown
+            self._polling_task.cancel()
+            try:
+                await self._polling_task
+            except asyncio.CancelledError:
+                pass
+            except TelegramError as e:
+                log.warning("[TELEGRAM] Polling failed to start: %s", e)
+            self._polling_task = None
         if self.telegram_app:
-            await self.telegram_app.stop()
+            # Stop long polling before the Bot's connections go away
+            if self.telegram_app.updater.running:
+                await self.telegram_app.updater.stop()
+            if self.telegram_app.running:
+                await self.telegram_app.stop()
+            if self.owns_bot:
+                # Also shuts down the Bot the application was built with
+                await self.telegram_app.shutdown()
+            else:
+                # Other notifiers still use the Bot, so leave it running
+                await self.telegram_app.updater.shutdown()
+        await self.chat_manager.close()
+        await self.close()
 
     @property
     def registered_chat_count(self) -> int:
@@ -1,51 +1,244 @@
 """Telegram chat persistence management"""
 
+import asyncio
 import datetime
 import json
-from typing import Set, Optional
+import logging
+import os
+import tempfile
+from typing import Iterable, List, Set, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> dict:
+    """Parse JSON bytes, preferring orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: dict) -> bytes:
+    """Serialize to compact JSON bytes, preferring orjson when available"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+
+def _apply_ops(chats: Set[int], ops: Iterable[bytes]):
+    """Apply "+id" / "-id" change records to chats in order"""
+    for op in ops:
+        try:
+            chat_id = int(op[1:])
+        except ValueError:
+            # A torn final record from a crash mid-append
+            continue
+        if op[:1] == b"+":
+            chats.add(chat_id)
+        elif op[:1] == b"-":
+            chats.discard(chat_id)
+
+
+log = logging.getLogger(__name__)
+
+# Seconds to wait before writing, so bursts of registrations share one save
+SAVE_DELAY = 2.0
+
+# Logged changes after which the log is folded back into the chats file
+COMPACT_OPS = 1000
 
 
 class ChatManager:
-    """Manages persistent storage of Telegram chat IDs"""
+    """Manages persistent storage of Telegram chat IDs
+
+    The chats file holds a full snapshot; changes since then are appended to
+    a "+id" / "-id" log next to it and folded into the snapshot on close or
+    once COMPACT_OPS changes have accumulated.
+    """
 
     def __init__(self, chats_file: str = "telegram_chats.json"):
         self.chats_file = chats_file
+        self.log_file = chats_file + ".log"
         self._chats: Set[int] = set()
+        self._chats_snapshot: Tuple[int, ...] = ()
+        self._chats_dirty = True
+        self._pending_ops: List[bytes] = []
+        self._logged_ops = 0
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._save_task: Optional[asyncio.Task] = None
+        # Until the file has been read, the in-memory set is incomplete and
+        # must never be written over the snapshot
+        self._loaded = False
+
+    async def load_chats(self) -> Set[int]:
+        """Load known chat IDs from file without blocking the event loop
 
-    def load_chats(self) -> Set[int]:
-        """Load known chat IDs from file"""
+        Changes made before loading are kept and applied on top of the file.
+        """
+        # Let an in-flight append land in the log before reading it
+        if self._save_task and not self._save_task.done():
+            await self._save_task
         try:
-            with open(self.chats_file, "r") as f:
-                data = json.load(f)
-                self._chats = set(data.get("chat_ids", []))
-                return self._chats.copy()
+            data = await asyncio.to_thread(self._read_file)
         except FileNotFoundError:
-            return set()
-        except json.JSONDecodeError:
-            print(f"[ERROR] Corrupted {self.chats_file}, starting fresh")
-            return set()
+            data = {}
+        except ValueError:
+            log.error("[ERROR] Corrupted %s, starting fresh", self.chats_file)
+            data = {}
+        chats = set(data.get("chat_ids", []))
+        self._logged_ops = await asyncio.to_thread(self._replay_log, chats)
+        _apply_ops(chats, self._pending_ops)
+        self._chats = chats
+        self._chats_dirty = True
+        self._loaded = True
+        return self._chats.copy()
 
     def save_chats(self):
-        """Save known chat IDs to file"""
+        """Save pending chat changes to the log
+
+        Inside a running event loop the write is deferred by SAVE_DELAY and
+        done in a worker thread, coalescing any changes made meanwhile.
+        Without a loop the log is written immediately.
+        """
         try:
-            with open(self.chats_file, "w") as f:
-                json.dump(
-                    {
-                        "chat_ids": list(self._chats),
-                        "last_updated": datetime.datetime.now().isoformat(),
-                    },
-                    f,
-                    indent=2,
-                )
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._append_ops(self._take_pending())
+            return
+
+        saving = self._save_task and not self._save_task.done()
+        if not saving and not self._save_handle:
+            self._save_handle = loop.call_later(SAVE_DELAY, self._start_save)
+
+    async def compact(self):
+        """Fold the change log into the chats file and truncate it
+
+        Before load_chats has run, changes are only appended to the log.
+        """
+        # Log pending changes first, so they survive a failed snapshot write
+        ops = self._take_pending()
+        if ops:
+            await asyncio.to_thread(self._append_ops, ops)
+        if not self._loaded:
+            return
+        data = self._serialize()
+        await asyncio.to_thread(self._write_snapshot, data)
+
+    async def close(self):
+        """Write any pending changes to disk and compact the log"""
+        if self._save_handle:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if self._save_task and not self._save_task.done():
+            await self._save_task
+        if self._pending_ops or self._logged_ops:
+            await self.compact()
+
+    def _start_save(self):
+        """Timer callback that starts the background save"""
+        self._save_handle = None
+        self._save_task = asyncio.create_task(self._save_pending())
+
+    async def _save_pending(self):
+        """Append changes off the event loop until none remain unsaved"""
+        while self._pending_ops:
+            compact_due = self._logged_ops + len(self._pending_ops) >= COMPACT_OPS
+            if compact_due and self._loaded:
+                await self.compact()
+            else:
+                await asyncio.to_thread(self._append_ops, self._take_pending())
+
+    def _record(self, op: str, chat_id: int):
+        """Queue a "+id" or "-id" change for the log"""
+        self._chats_dirty = True
+        self._pending_ops.append(f"{op}{chat_id}\n".encode())
+
+    def _take_pending(self) -> List[bytes]:
+        """Hand over queued changes, marking them as saved"""
+        ops, self._pending_ops = self._pending_ops, []
+        return ops
+
+    def _serialize(self) -> bytes:
+        """Serialize current chat IDs"""
+        return _dumps(
+            {
+                "chat_ids": list(self._chats),
+                "last_updated": datetime.datetime.now().isoformat(),
+            }
+        )
+
+    def _append_ops(self, ops: List[bytes]):
+        """Append changes to the log and sync them, reporting failures"""
+        try:
+            with open(self.log_file, "ab") as f:
+                f.write(b"".join(ops))
+                f.flush()
+                os.fsync(f.fileno())
+            self._logged_ops += len(ops)
         except Exception as e:
-            print(f"[ERROR] Failed to save chats: {e}")
+            log.error("[ERROR] Failed to save chats: %s", e)
+
+    def _write_snapshot(self, data: bytes):
+        """Replace the chats file, then drop the log it now covers"""
+        try:
+            self._write_atomic(data)
+            # The snapshot is synced to disk by now, and replaying a stale
+            # log over it is harmless, so a crash between these two steps
+            # loses nothing
+            with open(self.log_file, "wb"):
+                pass
+            self._logged_ops = 0
+        except Exception as e:
+            log.error("[ERROR] Failed to save chats: %s", e)
+
+    def _read_file(self) -> dict:
+        """Read and parse the chats file"""
+        with open(self.chats_file, "rb") as f:
+            return _loads(f.read())
+
+    def _replay_log(self, chats: Set[int]) -> int:
+        """Apply logged changes to chats, returning how many were read"""
+        try:
+            with open(self.log_file, "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return 0
+
+        _apply_ops(chats, lines)
+        return len(lines)
+
+    def _write_atomic(self, data: bytes):
+        """Write data durably via a temp file so readers never see a partial file"""
+        directory = os.path.dirname(os.path.abspath(self.chats_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.chats_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        # Make the rename itself durable before callers rely on it
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
     def add_chat(self, chat_id: int, chat_title: Optional[str] = None) -> bool:
         """Add a new chat to the list. Returns True if chat was added (new)."""
         if chat_id not in self._chats:
             self._chats.add(chat_id)
+            self._record("+", chat_id)
             self.save_chats()
-            print(f"[TELEGRAM] Added new chat: {chat_id} ({chat_title or 'Unknown'})")
+            log.info(
+                "[TELEGRAM] Added new chat: %s (%s)", chat_id, chat_title or "Unknown"
+            )
             return True
         return False
 
@@ -53,19 +246,40 @@ class ChatManager:
         """Remove a chat from the list"""
         if chat_id in self._chats:
             self._chats.discard(chat_id)
+            self._record("-", chat_id)
             self.save_chats()
 
-    def remove_invalid_chats(self, invalid_chat_ids: Set[int]):
-        """Remove multiple invalid chats at once"""
-        if invalid_chat_ids:
-            self._chats -= invalid_chat_ids
+    def remove_invalid_chats(self, invalid_chat_ids: Iterable[int]):
+        """Remove multiple invalid chats at once, saving only if any were known"""
+        removed = self._chats.intersection(invalid_chat_ids)
+        if removed:
+            self._chats.difference_update(removed)
+            for chat_id in removed:
+                self._record("-", chat_id)
             self.save_chats()
 
+    def __contains__(self, chat_id: int) -> bool:
+        """Check whether a chat ID is registered"""
+        return chat_id in self._chats
+
     @property
     def chats(self) -> Set[int]:
-        """Get current set of chat IDs"""
+        """Get a mutable copy of the chat IDs; use chats_snapshot on hot paths"""
         return self._chats.copy()
 
+    @property
+    def chats_snapshot(self) -> Tuple[int, ...]:
+        """Get immutable snapshot of chat IDs, rebuilt only after changes"""
+        if self._chats_dirty:
+            self._chats_snapshot = tuple(self._chats)
+            self._chats_dirty = False
+        return self._chats_snapshot
+
+    @property
+    def loaded(self) -> bool:
+        """Whether chats have been loaded from disk"""
+        return self._loaded
+
     @property
     def count(self) -> int:
         """Get number of registered chats"""
@@ -0,0 +1,83 @@
+"""Token-bucket rate limiting for Telegram Bot API calls"""
+
+import asyncio
+import time
+from typing import Dict, Hashable
+
+# Telegram allows about 30 messages per second overall and one per second
+# per chat; stay a little under the global limit
+GLOBAL_SEND_RATE = 25.0
+PER_CHAT_SEND_RATE = 1.0
+
+
+class AsyncTokenBucket:
+    """Token bucket allowing `rate` acquisitions per second, bursting to `capacity`
+
+    Use as an async context manager; entering waits until a token is available.
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait for and take one token"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def idle(self) -> bool:
+        """True if nobody is waiting and the bucket has refilled to capacity"""
+        if self._lock.locked():
+            return False
+        refill = (time.monotonic() - self._updated) * self.rate
+        return self._tokens + refill >= self.capacity
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class PerKeyLimiter:
+    """Hands out one token bucket per key
+
+    Buckets are dropped once idle, since a full bucket behaves exactly like a
+    new one; the sweep runs whenever the number of buckets doubles, so idle
+    chats cost no memory for long.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[Hashable, AsyncTokenBucket] = {}
+        self._sweep_at = 64
+
+    def get(self, key: Hashable) -> AsyncTokenBucket:
+        """Get the bucket for key, creating it if needed"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self._sweep_at:
+                self._evict_idle()
+            bucket = AsyncTokenBucket(self.rate, self.capacity)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _evict_idle(self):
+        """Drop buckets that have refilled and have no waiters"""
+        self._buckets = {k: b for k, b in self._buckets.items() if not b.idle()}
+        self._sweep_at = max(64, 2 * len(self._buckets))